@@ -1,17 +1,68 @@
+from __future__ import annotations
+
+import itertools
 import socket
-import json
 import os
+import queue
+import random
+import struct
 import time
-import asyncio
 import threading
-from typing import Callable, Optional
+
+# Constant-False so the typing module is never imported at runtime;
+# type checkers still follow the block. asyncio is imported lazily in
+# the async-path methods for the same reason: sync-only consumers
+# (short-lived CLIs, cold starts) skip both import costs entirely.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    # orjson serializes straight to bytes and parses bytes directly,
+    # skipping the str encode/decode round-trip on every RPC.
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+else:
+    import json
+
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
 
 class GICSClient:
     """
-    A zero-dependency Python client for the GICS Daemon.
+    A Python client for the GICS Daemon with no required dependencies
+    (orjson is used for JSON encoding when installed).
     Supports Unix Sockets (Linux/Mac) and Named Pipes (Windows).
     """
 
+    # Attribute shape is fixed in __init__; slots drop the per-instance
+    # __dict__ and make attribute access a direct slot lookup.
+    __slots__ = (
+        'address',
+        '_framing',
+        '_token',
+        '_next_request_id',
+        '_max_retries',
+        '_retry_delay',
+        '_request_timeout',
+        '_pool_size',
+        '_pool',
+        '_async_pool',
+        '_async_pool_loop',
+        '_envelope_prefix',
+        '_ping_head',
+    )
+
     def __init__(
         self,
         address=None,
@@ -20,11 +71,20 @@ class GICSClient:
         retry_delay=0.1,
         request_timeout=5.0,
         pool_size=4,
+        framing='line',
+        warm=False,
     ):
         """
         :param address: Path to the socket or named pipe. 
                         Defaults to /tmp/gics.sock or \\.\\pipe\\gics.
         :param token: Security token from .gics_token.
+        :param framing: 'line' (newline-delimited, the default) or 'length'
+                        (4-byte big-endian length prefix). Length framing
+                        needs a daemon built with v2 framing support and
+                        skips the newline scan on both sides.
+        :param warm: Pre-open pool_size connections at construction so the
+                     first calls skip the connect cost. Connect errors then
+                     surface immediately instead of on first use.
         """
         if address is None:
             if os.name == 'nt':
@@ -34,82 +94,211 @@ class GICSClient:
         else:
             self.address = address
 
+        if framing not in ('line', 'length'):
+            raise ValueError(f"Unknown framing: {framing!r}")
+        if framing == 'length' and os.name == 'nt':
+            raise ValueError("Length framing requires the Unix socket transport")
+        self._framing = framing
+
         self._token = token
-        self._request_id = 1
+        # Bound method of a C-level iterator: next() is a single atomic
+        # increment under the GIL, so no lock is needed around the counter.
+        self._next_request_id = itertools.count(1).__next__
         self._max_retries = max_retries
         self._retry_delay = retry_delay
         self._request_timeout = request_timeout
         self._pool_size = max(1, int(pool_size))
-        self._pool = []
-        self._pool_lock = threading.Lock()
-        self._request_id_lock = threading.Lock()
-
-    def _next_request_id(self):
-        with self._request_id_lock:
-            rid = self._request_id
-            self._request_id += 1
-            return rid
-
-    def _get_token(self):
-        if self._token:
-            return self._token
-        
-        # Try to find .gics_token in current or parent dirs
-        paths = [
-            '.gics_token',
-            os.path.expanduser('~/.gics_token'),
-            '../.gics_token'
-        ]
-        for p in paths:
-            if os.path.exists(p):
-                with open(p, 'r') as f:
-                    self._token = f.read().strip()
-                    return self._token
-        return None
+        # LIFO so the most recently used (cache-warm) connection is reused
+        # first; the queue's own C-level locking replaces _pool_lock.
+        self._pool = queue.LifoQueue(maxsize=self._pool_size)
+        # Async connections are bound to the event loop that opened them;
+        # the pool is rebuilt if a different loop shows up (see
+        # _acquire_async_connection).
+        self._async_pool = []
+        self._async_pool_loop = None
+        self._envelope_prefix = None
+        self._resolve_token_once()
+        if warm:
+            self._warm_pool()
+
+    def _warm_pool(self):
+        # Open the connections in parallel: warming is bounded by one
+        # connect latency, not pool_size of them.
+        import concurrent.futures
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self._pool_size) as ex:
+            futures = [ex.submit(self._open_transport) for _ in range(self._pool_size)]
+
+        # The executor has joined, so every future is done. If any connect
+        # failed, close the ones that did open before re-raising -- a
+        # partial warm-up must not leak connections.
+        conns = []
+        error = None
+        for future in futures:
+            if future.exception() is None:
+                conns.append(future.result())
+            elif error is None:
+                error = future.exception()
+
+        if error is not None:
+            for conn in conns:
+                self._close_transport(conn)
+            raise error
+
+        for conn in conns:
+            self._release_transport(conn)
+
+    def _resolve_token_once(self):
+        if not self._token:
+            # Try to find .gics_token in current or parent dirs
+            paths = [
+                '.gics_token',
+                os.path.expanduser('~/.gics_token'),
+                '../.gics_token'
+            ]
+            for p in paths:
+                if os.path.exists(p):
+                    with open(p, 'r') as f:
+                        self._token = f.read().strip()
+                    break
+
+        # Bake the token into the envelope prefix so _call never has to
+        # re-check (or re-stat) it on the hot path.
+        self._envelope_prefix = (
+            b'{"jsonrpc":"2.0","token":' + _json_dumps(self._token) + b',"method":"'
+        )
+        # ping is used as a liveness probe in tight loops; pre-serialize
+        # its whole envelope so only the id digits vary per call.
+        self._ping_head = self._envelope_prefix + b'ping","params":{},"id":'
+
+    def refresh_token(self, token=None):
+        """Re-resolve the security token, e.g. after a daemon token rotation."""
+        self._token = token
+        self._resolve_token_once()
+
+    # 1 MiB socket buffers let multi-KB insight/scan responses land in a
+    # single kernel transfer instead of several smaller ones.
+    _SOCKET_BUF_SIZE = 1 << 20
+
+    # Cap for the exponential retry backoff.
+    _MAX_RETRY_DELAY = 2.0
+
+    def _backoff_delay(self, attempt):
+        # Exponential backoff with jitter so concurrent clients spread
+        # their retries out instead of re-hitting a recovering daemon in
+        # lockstep.
+        delay = min(self._retry_delay * (2 ** attempt), self._MAX_RETRY_DELAY)
+        return delay * (0.5 + random.random() * 0.5)
+
+    # Reusable per-thread receive buffer for transports without a C-level
+    # buffered reader (the named-pipe path).
+    _recv_local = threading.local()
+
+    @classmethod
+    def _recv_buffer(cls):
+        buf = getattr(cls._recv_local, 'buf', None)
+        if buf is None:
+            buf = cls._recv_local.buf = bytearray(65536)
+        return buf
+
+    @classmethod
+    def _read_fd_line(cls, fd):
+        # Wrap the fd in a throwaway unbuffered FileIO (closefd=False keeps
+        # the pooled fd open) so readinto() lands each chunk directly in the
+        # reusable buffer -- no per-chunk bytes objects; the only remaining
+        # per-call allocation is the slice handed to the parser.
+        buf = cls._recv_buffer()
+        filled = 0
+        f = open(fd, 'rb', buffering=0, closefd=False)
+        try:
+            while True:
+                if filled == len(buf):
+                    # Response outgrew the buffer: grow it for this thread.
+                    buf = buf + bytearray(len(buf))
+                    cls._recv_local.buf = buf
+                n = f.readinto(memoryview(buf)[filled:])
+                if not n:
+                    raise ConnectionResetError("Daemon closed IPC pipe")
+                nl = buf.find(b'\n', filled, filled + n)
+                filled += n
+                if nl != -1:
+                    return buf[:nl + 1]
+        finally:
+            f.close()
 
     def _open_unix_socket(self):
-        s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # SOCK_CLOEXEC (where available) sets close-on-exec at creation,
+        # saving the separate fcntl call.
+        sock_type = socket.SOCK_STREAM | getattr(socket, 'SOCK_CLOEXEC', 0)
+        s = socket.socket(socket.AF_UNIX, sock_type)
+        try:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self._SOCKET_BUF_SIZE)
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self._SOCKET_BUF_SIZE)
+        except OSError:
+            pass  # Buffer sizing is best-effort; defaults still work.
         s.settimeout(self._request_timeout)
         s.connect(self.address)
-        return s
-
-    def _acquire_unix_socket(self):
-        with self._pool_lock:
-            if self._pool:
-                return self._pool.pop()
+        # The paired BufferedReader keeps response framing (readline) in
+        # CPython's C I/O layer instead of a Python-level recv/concat loop.
+        rf = s.makefile('rb', buffering=65536)
+        return (s, rf)
+
+    def _open_named_pipe(self):
+        # A raw fd pooled across calls: one CreateFile when the connection
+        # is first opened instead of one per RPC, and os.write/os.read are
+        # thinner than Python file-object methods.
+        return os.open(self.address, os.O_RDWR | getattr(os, 'O_BINARY', 0))
+
+    def _open_transport(self):
+        if os.name == 'nt':
+            return self._open_named_pipe()
         return self._open_unix_socket()
 
-    def _release_unix_socket(self, s, healthy=True):
-        if s is None:
-            return
+    def _acquire_transport(self):
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return self._open_transport()
 
-        if not healthy:
+    @staticmethod
+    def _close_transport(conn):
+        if isinstance(conn, int):
             try:
-                s.close()
+                os.close(conn)
             except OSError:
                 pass
             return
 
-        with self._pool_lock:
-            if len(self._pool) < self._pool_size:
-                self._pool.append(s)
-                return
-
+        s, rf = conn
+        try:
+            rf.close()
+        except OSError:
+            pass
         try:
             s.close()
         except OSError:
             pass
 
-    def close(self):
-        with self._pool_lock:
-            sockets = self._pool
-            self._pool = []
+    def _release_transport(self, conn, healthy=True):
+        if conn is None:
+            return
+
+        if not healthy:
+            self._close_transport(conn)
+            return
+
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            self._close_transport(conn)
 
-        for s in sockets:
+    def close(self):
+        while True:
             try:
-                s.close()
-            except OSError:
-                pass
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            self._close_transport(conn)
 
     def __enter__(self):
         return self
@@ -117,65 +306,262 @@ class GICSClient:
     def __exit__(self, exc_type, exc, tb):
         self.close()
 
-    def _call(self, method, params=None):
-        params = params or {}
-        request = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params,
-            "id": self._next_request_id(),
-            "token": self._get_token()
-        }
+    def _build_envelope(self, method, params, rid):
+        # No-arg RPCs (flush/compact/rotate/getClusters/...) splice a
+        # literal instead of serializing an empty dict.
+        params_bytes = _json_dumps(params) if params else b'{}'
+        return (
+            self._envelope_prefix
+            + method.encode('ascii')
+            + b'","params":'
+            + params_bytes
+            + b',"id":'
+            + str(rid).encode('ascii')
+            + b'}'
+        )
+
+    def _frame(self, body):
+        if self._framing == 'length':
+            return struct.pack('>I', len(body)) + body
+        return body + b'\n'
+
+    def _build_payload(self, method, params, rid):
+        return self._frame(self._build_envelope(method, params, rid))
+
+    def _read_response(self, rf):
+        if self._framing == 'length':
+            # O(1) framing: read the 4-byte length, then exactly that many
+            # bytes -- no scan of the response body for a delimiter.
+            header = rf.read(4)
+            if len(header) < 4:
+                raise ConnectionResetError("Daemon closed IPC socket")
+            (length,) = struct.unpack('>I', header)
+            body = rf.read(length)
+            if len(body) < length:
+                raise ConnectionResetError("Daemon closed IPC socket")
+            return body
+
+        line = rf.readline()
+        if not line.endswith(b'\n'):
+            # Socket closed by daemon, force reconnect on next attempt.
+            raise ConnectionResetError("Daemon closed IPC socket")
+        return line
+
+    async def _aread_response(self, reader):
+        import asyncio
+
+        if self._framing == 'length':
+            try:
+                header = await reader.readexactly(4)
+                (length,) = struct.unpack('>I', header)
+                return await reader.readexactly(length)
+            except asyncio.IncompleteReadError:
+                raise ConnectionResetError("Daemon closed IPC socket") from None
+
+        # readuntil with LimitOverrunError tolerance: responses are not
+        # bounded by the stream limit (the sync path has no cap either),
+        # so drain the scanned-but-separator-free bytes and keep going.
+        chunks = []
+        while True:
+            try:
+                chunks.append(await reader.readuntil(b'\n'))
+                return b''.join(chunks)
+            except asyncio.IncompleteReadError:
+                raise ConnectionResetError("Daemon closed IPC socket") from None
+            except asyncio.LimitOverrunError as e:
+                chunks.append(await reader.readexactly(e.consumed))
 
-        payload = (json.dumps(request) + '\n').encode('utf-8')
+    def _call(self, method, params=None):
+        payload = self._build_payload(method, params or {}, self._next_request_id())
+        return self._roundtrip(payload)
 
+    def _roundtrip(self, payload):
         last_error = None
         for attempt in range(self._max_retries + 1):
             try:
-                if os.name == 'nt':
-                    # Windows Named Pipe
-                    with open(self.address, 'r+b', buffering=0) as f:
-                        f.write(payload)
-                        response_line = f.readline()
-                        return json.loads(response_line.decode('utf-8'))
-                else:
-                    # Unix Socket with basic connection pooling + auto-reconnect.
-                    s = None
-                    healthy = True
+                # Pooled transport (Unix socket or named-pipe fd) with
+                # auto-reconnect on unhealthy connections.
+                conn = None
+                healthy = True
+                try:
+                    conn = self._acquire_transport()
                     try:
-                        s = self._acquire_unix_socket()
-                        try:
-                            s.sendall(payload)
-
-                            buffer = b""
-                            while True:
-                                chunk = s.recv(4096)
-                                if not chunk:
-                                    # Socket closed by daemon, force reconnect on next attempt.
-                                    healthy = False
-                                    raise ConnectionResetError("Daemon closed IPC socket")
-                                buffer += chunk
-                                if b'\n' in buffer:
-                                    break
-
-                            response_line = buffer.split(b'\n')[0]
-                            return json.loads(response_line.decode('utf-8'))
-                        except (OSError, ConnectionError, TimeoutError, json.JSONDecodeError):
-                            healthy = False
-                            raise
-                    finally:
-                        self._release_unix_socket(s, healthy=healthy)
-            except (FileNotFoundError, ConnectionRefusedError, OSError, json.JSONDecodeError) as e:
+                        if isinstance(conn, int):
+                            # Windows named pipe fd.
+                            view = memoryview(payload)
+                            while view:
+                                written = os.write(conn, view)
+                                view = view[written:]
+                            return _json_loads(self._read_fd_line(conn))
+
+                        s, rf = conn
+                        s.sendall(payload)
+                        return _json_loads(self._read_response(rf))
+                    except (OSError, ConnectionError, TimeoutError, _JSONDecodeError):
+                        healthy = False
+                        raise
+                finally:
+                    self._release_transport(conn, healthy=healthy)
+            except (FileNotFoundError, ConnectionRefusedError, OSError, _JSONDecodeError) as e:
                 last_error = e
                 if attempt < self._max_retries:
-                    time.sleep(self._retry_delay)
+                    time.sleep(self._backoff_delay(attempt))
+                else:
+                    raise
+
+        raise last_error
+
+    def _acquire_async_connection(self):
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        if self._async_pool_loop is not loop:
+            # Entries opened under a previous loop are unusable here, so
+            # close them instead of leaking one fd per pooled connection.
+            stale, self._async_pool = self._async_pool, []
+            self._async_pool_loop = loop
+            for _, writer in stale:
+                transport = writer.transport
+                try:
+                    transport.close()
+                except RuntimeError:
+                    # The owning loop is already closed and cannot run the
+                    # transport's callbacks; close the underlying socket
+                    # object directly. It is the same object the transport
+                    # would close, so this cannot double-close the fd.
+                    sock = getattr(transport, '_sock', None)
+                    if sock is not None:
+                        sock.close()
+        if self._async_pool:
+            return self._async_pool.pop()
+        return None
+
+    def _release_async_connection(self, conn, healthy=True):
+        if conn is None:
+            return
+
+        if healthy and len(self._async_pool) < self._pool_size:
+            self._async_pool.append(conn)
+            return
+
+        _, writer = conn
+        writer.close()
+
+    async def aclose(self):
+        """Close pooled async connections (from the loop that opened them)."""
+        conns, self._async_pool = self._async_pool, []
+        for _, writer in conns:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    async def _aroundtrip(self, payload):
+        import asyncio
+
+        if os.name == 'nt':
+            # No asyncio stream support for named pipes here; keep the
+            # thread-offload path on Windows.
+            return await asyncio.to_thread(self._roundtrip, payload)
+
+        last_error = None
+        for attempt in range(self._max_retries + 1):
+            try:
+                conn = self._acquire_async_connection()
+                if conn is None:
+                    conn = await asyncio.wait_for(
+                        # Match the socket buffer size; the default 64 KiB
+                        # stream limit makes readline() blow up on large
+                        # scan/insight responses.
+                        asyncio.open_unix_connection(
+                            self.address, limit=self._SOCKET_BUF_SIZE
+                        ),
+                        self._request_timeout,
+                    )
+                healthy = True
+                try:
+                    reader, writer = conn
+                    writer.write(payload)
+                    await writer.drain()
+
+                    response = await asyncio.wait_for(
+                        self._aread_response(reader), self._request_timeout
+                    )
+                    return _json_loads(response)
+                # ValueError covers JSON decode errors and stream-limit
+                # overruns; asyncio.TimeoutError is distinct from
+                # TimeoutError before 3.11. Either way the stream may be
+                # desynced, so never pool it again.
+                except (OSError, ConnectionError, TimeoutError,
+                        asyncio.TimeoutError, ValueError):
+                    healthy = False
+                    raise
+                finally:
+                    self._release_async_connection(conn, healthy=healthy)
+            except (FileNotFoundError, ConnectionRefusedError, OSError,
+                    TimeoutError, asyncio.TimeoutError, _JSONDecodeError) as e:
+                last_error = e
+                if attempt < self._max_retries:
+                    await asyncio.sleep(self._backoff_delay(attempt))
                 else:
                     raise
 
         raise last_error
 
     async def _acall(self, method, params=None):
-        return await asyncio.to_thread(self._call, method, params)
+        payload = self._build_payload(method, params or {}, self._next_request_id())
+        return await self._aroundtrip(payload)
+
+    def batch(self, calls):
+        """
+        Send several RPCs as a single JSON-RPC 2.0 batch array (one socket
+        round-trip) and return the unwrapped results in call order.
+
+        :param calls: Iterable of (method, params) pairs; params may be None.
+                      Requires a daemon that handles JSON-RPC batch requests.
+        """
+        ids, payload = self._build_batch(calls)
+        if not ids:
+            return []
+        return self._unwrap_batch(self._roundtrip(payload), ids)
+
+    def _build_batch(self, calls):
+        ids = []
+        parts = []
+        for method, params in calls:
+            rid = self._next_request_id()
+            ids.append(rid)
+            parts.append(self._build_envelope(method, params or {}, rid))
+
+        if not parts:
+            return [], b''
+        # The batch array is framed as a whole.
+        return ids, self._frame(b'[' + b','.join(parts) + b']')
+
+    def _unwrap_batch(self, responses, ids):
+        if not isinstance(responses, list):
+            # A daemon that rejects the batch wholesale answers with a
+            # single error envelope.
+            return [self._unwrap_result(responses)]
+
+        by_id = {resp.get('id'): resp for resp in responses}
+        results = []
+        for rid in ids:
+            resp = by_id.get(rid)
+            if resp is None:
+                raise RuntimeError(f"GICS batch response missing id {rid}")
+            results.append(self._unwrap_result(resp))
+        return results
+
+    async def abatch(self, calls):
+        ids, payload = self._build_batch(calls)
+        if not ids:
+            return []
+        return self._unwrap_batch(await self._aroundtrip(payload), ids)
+
+    async def aget_many(self, keys):
+        return await self.abatch([("get", {"key": k}) for k in keys])
 
     def _unwrap_result(self, response: dict):
         if response.get('error'):
@@ -184,115 +570,47 @@ class GICSClient:
             raise RuntimeError(f"GICS error {code}: {message}")
         return response.get('result')
 
-    def put(self, key, fields):
-        resp = self._call("put", {"key": key, "fields": fields})
-        return self._unwrap_result(resp).get('ok', False)
-
-    def get(self, key):
-        resp = self._call("get", {"key": key})
-        return self._unwrap_result(resp)
-
-    def delete(self, key):
-        resp = self._call("delete", {"key": key})
-        return self._unwrap_result(resp).get('ok', False)
-
-    def scan(self, prefix=""):
-        resp = self._call("scan", {"prefix": prefix})
-        return self._unwrap_result(resp).get('items', [])
-
-    def flush(self):
-        resp = self._call("flush")
-        return self._unwrap_result(resp)
-
-    def compact(self):
-        resp = self._call("compact")
-        return self._unwrap_result(resp)
-
-    def rotate(self):
-        resp = self._call("rotate")
-        return self._unwrap_result(resp)
-
-    def verify(self, tier=None):
-        params = {}
-        if tier is not None:
-            params["tier"] = tier
-        resp = self._call("verify", params)
-        return self._unwrap_result(resp)
-
-    def get_insight(self, key):
-        resp = self._call("getInsight", {"key": key})
-        return self._unwrap_result(resp)
-
-    def get_insights(self, insight_type=None):
-        params = {}
-        if insight_type:
-            params["type"] = insight_type
-        resp = self._call("getInsights", params)
-        return self._unwrap_result(resp)
-
-    def report_outcome(self, insight_id, result, context=None):
-        params = {"insightId": insight_id, "result": result}
-        if context is not None:
-            params["context"] = context
-        resp = self._call("reportOutcome", params)
-        return self._unwrap_result(resp).get('ok', False)
-
-    def get_correlations(self, key=None):
-        params = {}
-        if key is not None:
-            params["key"] = key
-        resp = self._call("getCorrelations", params)
-        return self._unwrap_result(resp)
-
-    def get_clusters(self):
-        resp = self._call("getClusters")
-        return self._unwrap_result(resp)
-
-    def get_leading_indicators(self, key=None):
-        params = {}
-        if key is not None:
-            params["key"] = key
-        resp = self._call("getLeadingIndicators", params)
-        return self._unwrap_result(resp)
-
-    def get_seasonal_patterns(self, key=None):
-        params = {}
-        if key is not None:
-            params["key"] = key
-        resp = self._call("getSeasonalPatterns", params)
-        return self._unwrap_result(resp)
-
-    def get_forecast(self, key, field, horizon=None):
-        params = {"key": key, "field": field}
-        if horizon is not None:
-            params["horizon"] = horizon
-        resp = self._call("getForecast", params)
-        return self._unwrap_result(resp)
-
-    def get_anomalies(self, since=None):
-        params = {}
-        if since is not None:
-            params["since"] = since
-        resp = self._call("getAnomalies", params)
-        return self._unwrap_result(resp)
-
-    def get_recommendations(self, filter_type=None, target=None):
-        params = {}
-        if filter_type is not None:
-            params["type"] = filter_type
-        if target is not None:
-            params["target"] = target
-        resp = self._call("getRecommendations", params)
-        return self._unwrap_result(resp)
-
-    def get_accuracy(self, insight_type=None, scope=None):
-        params = {}
-        if insight_type is not None:
-            params["insightType"] = insight_type
-        if scope is not None:
-            params["scope"] = scope
-        resp = self._call("getAccuracy", params)
-        return self._unwrap_result(resp)
+    def _unwrap_bool(self, response: dict, key='ok'):
+        # Collapses the _unwrap_result(resp).get('ok', False) chain for
+        # ack-style RPCs into one error check plus one lookup. 'result'
+        # is accessed by subscript: JSON-RPC guarantees it when there is
+        # no error member.
+        error = response.get('error')
+        if error:
+            code = error.get('code', -1)
+            message = error.get('message', 'Unknown error')
+            raise RuntimeError(f"GICS error {code}: {message}")
+        return response['result'].get(key, False)
+
+    def iter_scan(self, prefix="", page_size=1000):
+        """
+        Lazily iterate scan results in pages of page_size, so peak memory
+        stays O(page_size) instead of materializing the full item list.
+        Requires a daemon whose scan supports cursor/limit paging.
+        """
+        cursor = None
+        while True:
+            params = {"prefix": prefix, "limit": page_size}
+            if cursor is not None:
+                params["cursor"] = cursor
+            result = self._unwrap_result(self._call("scan", params))
+            yield from result.get('items', [])
+            cursor = result.get('nextCursor')
+            if not cursor:
+                return
+
+    async def aiter_scan(self, prefix="", page_size=1000):
+        cursor = None
+        while True:
+            params = {"prefix": prefix, "limit": page_size}
+            if cursor is not None:
+                params["cursor"] = cursor
+            result = self._unwrap_result(await self._acall("scan", params))
+            for item in result.get('items', []):
+                yield item
+            cursor = result.get('nextCursor')
+            if not cursor:
+                return
 
     def subscribe(self, event_types, callback: Optional[Callable[[dict], None]] = None):
         resp = self._call("subscribe", {"events": event_types})
@@ -300,134 +618,114 @@ class GICSClient:
         # Callback wiring for streaming transport is deferred to daemon event-stream phase.
         return result.get("subscriptionId")
 
-    def unsubscribe(self, subscription_id):
-        resp = self._call("unsubscribe", {"subscriptionId": subscription_id})
-        return self._unwrap_result(resp).get("ok", False)
-
-    def ping(self):
-        return self._unwrap_result(self._call("ping"))
-
-    async def aput(self, key: str, fields: dict) -> bool:
-        resp = await self._acall("put", {"key": key, "fields": fields})
-        return self._unwrap_result(resp).get('ok', False)
-
-    async def aget(self, key: str):
-        resp = await self._acall("get", {"key": key})
-        return self._unwrap_result(resp)
-
-    async def adelete(self, key: str) -> bool:
-        resp = await self._acall("delete", {"key": key})
-        return self._unwrap_result(resp).get('ok', False)
-
-    async def ascan(self, prefix: str = ""):
-        resp = await self._acall("scan", {"prefix": prefix})
-        return self._unwrap_result(resp).get('items', [])
-
-    async def aflush(self):
-        resp = await self._acall("flush")
-        return self._unwrap_result(resp)
-
-    async def acompact(self):
-        resp = await self._acall("compact")
-        return self._unwrap_result(resp)
-
-    async def arotate(self):
-        resp = await self._acall("rotate")
-        return self._unwrap_result(resp)
-
-    async def averify(self, tier: Optional[str] = None):
-        params = {}
-        if tier is not None:
-            params["tier"] = tier
-        resp = await self._acall("verify", params)
-        return self._unwrap_result(resp)
-
-    async def aget_insight(self, key: str):
-        resp = await self._acall("getInsight", {"key": key})
-        return self._unwrap_result(resp)
-
-    async def aget_insights(self, insight_type: Optional[str] = None):
-        params = {}
-        if insight_type:
-            params["type"] = insight_type
-        resp = await self._acall("getInsights", params)
-        return self._unwrap_result(resp)
-
-    async def areport_outcome(self, insight_id: str, result: str, context: Optional[str] = None) -> bool:
-        params = {"insightId": insight_id, "result": result}
-        if context is not None:
-            params["context"] = context
-        resp = await self._acall("reportOutcome", params)
-        return self._unwrap_result(resp).get('ok', False)
-
-    async def aget_correlations(self, key: Optional[str] = None):
-        params = {}
-        if key is not None:
-            params["key"] = key
-        resp = await self._acall("getCorrelations", params)
-        return self._unwrap_result(resp)
-
-    async def aget_clusters(self):
-        resp = await self._acall("getClusters")
-        return self._unwrap_result(resp)
-
-    async def aget_leading_indicators(self, key: Optional[str] = None):
-        params = {}
-        if key is not None:
-            params["key"] = key
-        resp = await self._acall("getLeadingIndicators", params)
-        return self._unwrap_result(resp)
-
-    async def aget_seasonal_patterns(self, key: Optional[str] = None):
-        params = {}
-        if key is not None:
-            params["key"] = key
-        resp = await self._acall("getSeasonalPatterns", params)
-        return self._unwrap_result(resp)
-
-    async def aget_forecast(self, key: str, field: str, horizon: Optional[int] = None):
-        params = {"key": key, "field": field}
-        if horizon is not None:
-            params["horizon"] = horizon
-        resp = await self._acall("getForecast", params)
-        return self._unwrap_result(resp)
-
-    async def aget_anomalies(self, since: Optional[int] = None):
-        params = {}
-        if since is not None:
-            params["since"] = since
-        resp = await self._acall("getAnomalies", params)
-        return self._unwrap_result(resp)
-
-    async def aget_recommendations(self, filter_type: Optional[str] = None, target: Optional[str] = None):
-        params = {}
-        if filter_type is not None:
-            params["type"] = filter_type
-        if target is not None:
-            params["target"] = target
-        resp = await self._acall("getRecommendations", params)
-        return self._unwrap_result(resp)
-
-    async def aget_accuracy(self, insight_type: Optional[str] = None, scope: Optional[str] = None):
-        params = {}
-        if insight_type is not None:
-            params["insightType"] = insight_type
-        if scope is not None:
-            params["scope"] = scope
-        resp = await self._acall("getAccuracy", params)
-        return self._unwrap_result(resp)
-
     async def asubscribe(self, event_types: list[str]):
         resp = await self._acall("subscribe", {"events": event_types})
         return self._unwrap_result(resp).get("subscriptionId")
 
-    async def aunsubscribe(self, subscription_id: str) -> bool:
-        resp = await self._acall("unsubscribe", {"subscriptionId": subscription_id})
-        return self._unwrap_result(resp).get("ok", False)
+    def ping(self):
+        body = self._ping_head + str(self._next_request_id()).encode('ascii') + b'}'
+        return self._unwrap_result(self._roundtrip(self._frame(body)))
 
     async def aping(self):
-        resp = await self._acall("ping")
-        return self._unwrap_result(resp)
+        body = self._ping_head + str(self._next_request_id()).encode('ascii') + b'}'
+        return self._unwrap_result(await self._aroundtrip(self._frame(body)))
+
+
+# Parameter spec modes for the generated RPC wrappers below.
+REQ = 'req'        # positional, always sent
+DEF = 'def'        # keyword with a default (given as source text), always sent
+OPT = 'opt'        # default None, sent only when not None
+TRUTHY = 'truthy'  # default None, sent only when truthy
+
+# (python name, RPC method, parameter specs, result pluck).
+# Each parameter spec is (python arg, JSON key, mode[, default source]);
+# a pluck of (key, default) returns result.get(key, default), None returns
+# the raw result. Every entry yields a sync wrapper and an async a* twin.
+_RPC_METHODS = [
+    ("put", "put", [("key", "key", REQ), ("fields", "fields", REQ)], ("ok", False)),
+    ("get", "get", [("key", "key", REQ)], None),
+    ("delete", "delete", [("key", "key", REQ)], ("ok", False)),
+    ("scan", "scan", [("prefix", "prefix", DEF, '""')], ("items", [])),
+    ("flush", "flush", [], None),
+    ("compact", "compact", [], None),
+    ("rotate", "rotate", [], None),
+    ("verify", "verify", [("tier", "tier", OPT)], None),
+    ("get_insight", "getInsight", [("key", "key", REQ)], None),
+    ("get_insights", "getInsights", [("insight_type", "type", TRUTHY)], None),
+    ("report_outcome", "reportOutcome",
+     [("insight_id", "insightId", REQ), ("result", "result", REQ),
+      ("context", "context", OPT)], ("ok", False)),
+    ("get_correlations", "getCorrelations", [("key", "key", OPT)], None),
+    ("get_clusters", "getClusters", [], None),
+    ("get_leading_indicators", "getLeadingIndicators", [("key", "key", OPT)], None),
+    ("get_seasonal_patterns", "getSeasonalPatterns", [("key", "key", OPT)], None),
+    ("get_forecast", "getForecast",
+     [("key", "key", REQ), ("field", "field", REQ), ("horizon", "horizon", OPT)], None),
+    ("get_anomalies", "getAnomalies", [("since", "since", OPT)], None),
+    ("get_recommendations", "getRecommendations",
+     [("filter_type", "type", OPT), ("target", "target", OPT)], None),
+    ("get_accuracy", "getAccuracy",
+     [("insight_type", "insightType", OPT), ("scope", "scope", OPT)], None),
+    ("unsubscribe", "unsubscribe",
+     [("subscription_id", "subscriptionId", REQ)], ("ok", False)),
+]
+
+
+def _compile_rpc_wrapper(name, rpc, specs, pluck, is_async):
+    # Build the wrapper from generated source and exec it, the same
+    # technique stdlib dataclasses uses: the RPC name, params shape and
+    # optional-argument branches are baked into each method's bytecode
+    # once instead of being re-decided on every call.
+    args = ['self']
+    for spec in specs:
+        arg, mode = spec[0], spec[2]
+        if mode == REQ:
+            args.append(arg)
+        elif mode == DEF:
+            args.append(f'{arg}={spec[3]}')
+        else:
+            args.append(f'{arg}=None')
+
+    always = [(s[0], s[1]) for s in specs if s[2] in (REQ, DEF)]
+    optional = [(s[0], s[1], s[2]) for s in specs if s[2] in (OPT, TRUTHY)]
+    dict_src = '{' + ', '.join(f'"{key}": {arg}' for arg, key in always) + '}'
+
+    body = []
+    if not specs:
+        call_args = f'"{rpc}"'
+    elif not optional:
+        call_args = f'"{rpc}", {dict_src}'
+    else:
+        body.append(f'    params = {dict_src}')
+        for arg, key, mode in optional:
+            cond = f'{arg} is not None' if mode == OPT else arg
+            body.append(f'    if {cond}:')
+            body.append(f'        params["{key}"] = {arg}')
+        call_args = f'"{rpc}", params'
+
+    call = f'await self._acall({call_args})' if is_async else f'self._call({call_args})'
+    body.append(f'    resp = {call}')
+    if pluck is None:
+        body.append('    return self._unwrap_result(resp)')
+    elif pluck[1] is False:
+        body.append(f'    return self._unwrap_bool(resp, "{pluck[0]}")')
+    else:
+        key, default = pluck
+        body.append(f'    return self._unwrap_result(resp).get("{key}", {default!r})')
+
+    keyword = 'async def' if is_async else 'def'
+    source = f'{keyword} {name}({", ".join(args)}):\n' + '\n'.join(body)
+    namespace = {}
+    exec(source, namespace)
+    return namespace[name]
+
+
+for _name, _rpc, _specs, _pluck in _RPC_METHODS:
+    setattr(GICSClient, _name, _compile_rpc_wrapper(_name, _rpc, _specs, _pluck, False))
+    setattr(GICSClient, 'a' + _name,
+            _compile_rpc_wrapper('a' + _name, _rpc, _specs, _pluck, True))
+del _name, _rpc, _specs, _pluck
+
 
 # Example Usage:
 # client = GICSClient()
@@ -125,6 +125,30 @@ def main() -> int:
             flush = client.flush()
             assert flush.get("ok") is True
 
+            # refresh_token rebuilds the cached envelope prefix and the
+            # pre-serialized ping envelope; both call paths must still work.
+            client.refresh_token(token)
+            ping = client.ping()
+            assert ping.get("status") == "ok", ping
+
+            ok = client.put("it:item:2", {"score": 3})
+            assert ok is True
+            record = client.get("it:item:2")
+            assert record is not None
+            assert record.get("fields", {}).get("score") == 3
+            deleted = client.delete("it:item:2")
+            assert deleted is True
+
+        # warm=True pre-opens pool_size connections at construction; the
+        # first calls must be served over the pre-warmed pool.
+        with GICSClient(address=socket_path, token=token, pool_size=2, warm=True) as warm_client:
+            ping = warm_client.ping()
+            assert ping.get("status") == "ok", ping
+
+            ok = warm_client.put("it:warm:1", {"n": 1})
+            assert ok is True
+            assert warm_client.delete("it:warm:1") is True
+
         return 0
     finally:
         if daemon.poll() is None: